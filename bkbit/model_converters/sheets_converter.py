@@ -11,8 +11,14 @@ from linkml_runtime.utils.schemaview import SchemaView
 from schemasheets import schemamaker as sm
 import pandas as pd
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # libyaml bindings are not available
+    from yaml import SafeLoader, SafeDumper
+
 
 SIMPLE_TYPES_NOSTR = ["integer", "float", "boolean", "date", "datetime"]
+_SIMPLE_TYPES_SET = frozenset(SIMPLE_TYPES_NOSTR)
 
 
 def fix_tsv_files(tsv_files, inlined=False, ref_by_ind=True):
@@ -41,26 +47,25 @@ def fix_tsv_files(tsv_files, inlined=False, ref_by_ind=True):
         # read the file-like object to a pandas dataframe
         df = pd.read_csv(data, header=[0, 1, 2], delimiter='\t')
 
-        columns_to_change_new = []
-        for ind in df.columns:
-            if "mapping" in ind[1].lower():
-                columns_to_change_new.append(ind)
-        for col in columns_to_change_new:
+        columns = df.columns
+        header_0 = columns.get_level_values(0).str.lower().str.strip()
+        header_1 = columns.get_level_values(1).str.lower().str.strip()
+
+        for col in columns[header_1.str.contains("mapping", regex=False)]:
             df[col] = df[col].str.replace(" ", "%20")
 
         # finding the range column, and other columns that are relevant for the following changes
-        range_ind, range_col = None, None
-        multival_col, exactlyone_col, valset_col = None, None, None
-        for ind, col in enumerate(df.columns):
-            if "range" in col[1].lower().strip():
-                range_ind = ind
-                range_col = col
-            elif "multivalued" in col[0].lower().strip():
-                multival_col = col
-            elif "exactlyoneof" in col[0].lower().strip():
-                exactlyone_col = col
-            elif "permissible" in col[0].lower().strip():
-                valset_col = col
+        # (if a header matches more than one rule, the first rule wins; if several columns match, the last one is used)
+        range_mask = header_1.str.contains("range", regex=False)
+        multival_mask = header_0.str.contains("multivalued", regex=False) & ~range_mask
+        exactlyone_mask = header_0.str.contains("exactlyoneof", regex=False) & ~(range_mask | multival_mask)
+        valset_mask = header_0.str.contains("permissible", regex=False) & ~(range_mask | multival_mask | exactlyone_mask)
+
+        range_ind = _last_index(range_mask)
+        range_col = _column_at(columns, range_ind)
+        multival_col = _column_at(columns, _last_index(multival_mask))
+        exactlyone_col = _column_at(columns, _last_index(exactlyone_mask))
+        valset_col = _column_at(columns, _last_index(valset_mask))
 
         if range_ind is not None:
             any_of_col = (f"{range_col[0]}: any_of", "any_of", "inner_key: range")
@@ -80,7 +85,7 @@ def fix_tsv_files(tsv_files, inlined=False, ref_by_ind=True):
                 if pd.isna(row[range_col]):
                     return row
                 # do not add string to range if range already has string or all the elements are simple types
-                elif "string" in row[range_col] or all([el in SIMPLE_TYPES_NOSTR for el in row[range_col].split("|")]):
+                elif "string" in row[range_col] or all(el in _SIMPLE_TYPES_SET for el in row[range_col].split("|")):
                     pass
                 # checking if the range is not value set (TODO: in the future might need modification)
                 elif valset_col is not None and row[valset_col]:
@@ -114,6 +119,17 @@ def fix_tsv_files(tsv_files, inlined=False, ref_by_ind=True):
     return tsv_file_fixed_list
 
 
+def _last_index(mask):
+    """Returns the position of the last True value in a boolean mask, or None if there is none."""
+    positions = mask.nonzero()[0]
+    return int(positions[-1]) if len(positions) else None
+
+
+def _column_at(columns, ind):
+    """Returns the column name at the given position, or None if the position is None."""
+    return columns[ind] if ind is not None else None
+
+
 
 def bican_fix(schema: SchemaDefinition) -> SchemaDefinition:
     """
@@ -136,12 +152,16 @@ def bican_fix(schema: SchemaDefinition) -> SchemaDefinition:
         del schema.slots["name"]
 
     # removing slots that are from the imported schemas
-    slots_from_imports = []
+    schema_slots = set(schema.slots)
+    slots_to_remove = set()
     for el in schema.imports:
+        if not schema_slots:
+            break
         if Path(f"{el}.yaml").exists():
             sv = SchemaView(f'{el}.yaml')
-            slots_from_imports.extend(sv.schema.slots.keys())
-    slots_to_remove = list(set(schema.slots) & set(slots_from_imports))
+            imported_slots = schema_slots.intersection(sv.schema.slots)
+            slots_to_remove |= imported_slots
+            schema_slots -= imported_slots
 
     for nm in slots_to_remove:
         del schema.slots[nm]
@@ -158,7 +178,7 @@ def bican_fix(schema: SchemaDefinition) -> SchemaDefinition:
 
 def adding_template(schema:SchemaDefinition, template_yaml) -> SchemaDefinition:
     with (template_yaml).open() as file:
-        classes_base = yaml.safe_load(file)
+        classes_base = yaml.load(file, Loader=SafeLoader)
         for key, val in classes_base["classes"].items():
             schema.classes[key] = val
         for key, val in classes_base["slots"].items():
@@ -169,16 +189,17 @@ def adding_template(schema:SchemaDefinition, template_yaml) -> SchemaDefinition:
 def download_google_sheet_as_tsv(sheet_id, save_path, sheet_gid):
     # Construct the URL to export the Google Sheet as TSV
     tsv_url = f'https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=tsv&gid={sheet_gid}'
-    response = requests.get(tsv_url)
-    response.raise_for_status()  # Ensure the request was successful
-    # Save the TSV content to a file
-    with open(save_path, 'wb') as file:
-        file.write(response.content)
+    with requests.get(tsv_url, stream=True) as response:
+        response.raise_for_status()  # Ensure the request was successful
+        response.raw.decode_content = True
+        # Save the TSV content to a file
+        with open(save_path, 'wb') as file:
+            shutil.copyfileobj(response.raw, file)
 
 
 def read_and_parse_gsheet_yaml(gsheet_yaml):
     with open(gsheet_yaml, 'r') as file:
-        data = yaml.safe_load(file)
+        data = yaml.load(file, Loader=SafeLoader)
 
     gsheet_id = data['gsheet_id']
     sheets = data['sheets']
@@ -290,7 +311,7 @@ def schema2model(spreadsheets, output, fix_tsv, fix_tsv_save, repair, fix_bican_
         schema = adding_template(schema, template_yaml=template)
 
     schema_dict = schema_as_dict(schema)
-    output.write(yaml.dump(schema_dict, sort_keys=False))
+    output.write(yaml.dump(schema_dict, sort_keys=False, Dumper=SafeDumper))
     output.close()
 
     # removing the fixed files:
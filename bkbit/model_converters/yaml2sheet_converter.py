@@ -5,6 +5,7 @@ from pathlib import Path
 from linkml_runtime.utils.schemaview import SchemaView
 
 SIMPLE_TYPES_NOSTR = ["integer", "float", "boolean", "date", "datetime"]
+_SIMPLE_TYPES_FS = frozenset(SIMPLE_TYPES_NOSTR)
 
 CLASS_HEADERS = [
     # header, linkml_header, linkml_header_minor
@@ -31,7 +32,7 @@ SLOTS_HEADERS = [
     ("Max Value", "ignore", ""),
     ("Unit", "ignore", ""),
     ("Statistical Type", "ignore", ""),
-    ("Subsets", "in_subset", ""),
+    ("Subsets", "in_subset", 'internal_separator: "|"'),
     ("Notes", "ignore", ""),
     ("NIMP Category", "ignore", ""),
     ("NIMP Terminology NHash", "exact_mappings: {curie_prefix: NIMP}", ""),
@@ -74,19 +75,13 @@ def create_classes_slots_cvs(classes: dict, output_dir: Path):
         slots_cvs[1].append(linkml_header)
         slots_cvs[2].append(linkml_header_minor)
 
-    sl_header = \
-        ["Proposed BICAN Field", "LinkML Slot or Attribute Name", "BICAN UUID",	"SubGroup/LinkML Class Name", "Definition", "Required (True/False)", "Multivalued (True/False)", "Data Type/Value Set",	"Data Examples", "Min Value", "Max Value", "Unit", "Statistical Type", "Subsets", "Notes", "NIMP Category",	"NIMP Terminology NHash",               "Local Variable Name (e.g. NIMP)", "Local Variable Source (e.g. NIMP)"]
-    sl_linkml_header = \
-        ["> alias",              "attribute", "slot_uri: {curie_prefix: bican}", "class",                    "description", "is_required",          "multivalued",              "range",               "ignore",        "ignore",    "ignore",    "ignore", "ignore",         "in_subset", "ignore", "ignore",     "exact_mappings: {curie_prefix: NIMP}", "local_names",                     "local_names"]
-    sl_linkml_header_minor = [">",        "",          "",                                "",                         "",            "",                     "",                         "",                    "",              "",          "",          "",       "", 'internal_separator: "|"',	"",       "",           "",                                     "inner_key: local_name_value",     "inner_key: local_name_source"]
-    slots_cvs = [sl_header, sl_linkml_header, sl_linkml_header_minor]
     for class_name, class_d in classes.items():
-        if class_name in "NamedThing":
+        if class_name == "NamedThing":
             continue
         cl_l = [class_name, class_d.is_a, "|".join(class_d.mixins), "|".join(class_d.in_subset), class_d.description, ""]
         classes_cvs.append(cl_l)
-        class_attr_dict = class_d.attributes
-        class_attr_dict.update(class_d.slot_usage)
+        # merging into a new dict, so the class attributes are not modified
+        class_attr_dict = {**class_d.attributes, **class_d.slot_usage}
         for slot_name, slot_obj in class_attr_dict.items():
             if slot_obj.range:
                 range = slot_obj.range
@@ -97,8 +92,8 @@ def create_classes_slots_cvs(classes: dict, output_dir: Path):
                 range = "string" # default range
             sl_l = ["", slot_name, slot_obj.slot_uri, class_name, slot_obj.description, slot_obj.required, slot_obj.multivalued, range, "", "", "", "", "", "", "", "", "", "", ""]
             slots_cvs.append(sl_l)
-    _write_cvs(Path(output_dir / "classes.csv"), classes_cvs)
-    _write_cvs(Path(output_dir / "slots.csv"), slots_cvs)
+    _write_cvs(output_dir / "classes.tsv", classes_cvs)
+    _write_cvs(output_dir / "slots.tsv", slots_cvs)
 
 
 def create_enums_cvs(enums: dict, output_dir: Path):
@@ -111,7 +106,7 @@ def create_enums_cvs(enums: dict, output_dir: Path):
         for enum_name, enum in enums.items():
             for value_nm, value_obj in enum.permissible_values.items():
                 enums_cvs.append([enum_name, value_nm, value_obj.title, value_obj.meaning])
-    _write_cvs(Path(output_dir / "enums.csv"), enums_cvs)
+    _write_cvs(output_dir / "enums.tsv", enums_cvs)
 
 def create_prefix_headers_csv(schema: SchemaView, output_dir: Path):
     prefixes_cvs = [[], []]
@@ -125,7 +120,7 @@ def create_prefix_headers_csv(schema: SchemaView, output_dir: Path):
             prefixes_cvs.append(["", "", "", "", "", imp, "", ""])
     for prefix in schema.prefixes.values():
         prefixes_cvs.append(["", "", "", "", "", "", prefix.prefix_prefix, prefix.prefix_reference])
-    _write_cvs(Path(output_dir / "prefixes.csv"), prefixes_cvs)
+    _write_cvs(output_dir / "prefixes.tsv", prefixes_cvs)
 
 def _removing_str_type(any_of_list: list):
     """If the range list contains only more complex types, it removes string from the list.
@@ -133,27 +128,27 @@ def _removing_str_type(any_of_list: list):
     no need to include it in the google sheet
     """
     range_list = [el.range for el in any_of_list]
-    simple_types = ["integer", "float", "boolean", "date", "datetime"]
-    if "string" in range_list and not(any([el in simple_types for el in range_list])):
+    if "string" in range_list and _SIMPLE_TYPES_FS.isdisjoint(range_list):
         range_list.remove("string")
     return range_list
 
 
 def _write_cvs(filename, data):
-    with open(filename, 'w', newline='') as file:
-        csv_writer = csv.writer(file)
+    # tab-separated, to match the tsv files that are read by the sheets converter
+    with open(filename, 'w', newline='', buffering=1 << 20) as file:
+        csv_writer = csv.writer(file, delimiter='\t', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
         csv_writer.writerows(data)
 
 @click.command()
 @click.option('-o', '--output_dir',
               type=click.Path(),
               default="output_dir_cvs",
-              help="Path to the output directory, where csv files will be stored.")
+              help="Path to the output directory, where tsv files will be stored.")
 @click.argument('yaml_model', type=click.Path(exists=True))
 def yaml2cvs(yaml_model, output_dir):
     """
-    This converter create csv files from the yaml model.
-    The cvs files can be used to create Google Spreadsheet (automation TODO)
+    This converter create tsv files from the yaml model.
+    The tsv files can be used to create Google Spreadsheet (automation TODO)
     Takes a path to yaml model as an input.
     """
     output_dir = Path(output_dir)
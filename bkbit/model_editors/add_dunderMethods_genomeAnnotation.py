@@ -1,31 +1,57 @@
-import re
+import ast
+from pathlib import Path
 import pkg_resources
-# Read the file
-genome_annotation_model = pkg_resources.resource_filename(__name__, "../models/genome_annotation.py")
 
-#file_path = "bkbit/models/genome_annotation.py"
-with open(genome_annotation_model, "r") as file:
-    content = file.read()
+CLASS_NAME = "GeneAnnotation"
+# Methods that should be defined in the class, together with the code that is added if they don't exist
+DUNDER_METHODS = {
+    "__hash__": "\n    def __hash__(self):\n        return hash(tuple([self.id, self.name, self.molecular_type, self.description]))\n    \n",
+}
 
-# Define the patterns to check if the functions already exist
-hash_pattern = r"def __hash__\(self\):"
 
-# Find the GeneAnnotation class
-class_pattern = r"class GeneAnnotation\(Gene\):\s+\"\"\"\n    An annotation describing the location, boundaries, and functions of  individual genes within a genome annotation.\n    \"\"\""
-class_match = re.search(class_pattern, content)
+def add_dunder_methods(file_path):
+    """
+    Adds the missing DUNDER_METHODS to the GeneAnnotation class.
+    The file is rewritten only if at least one method was added.
 
-if class_match:
-    class_start = class_match.end()
+    :param file_path: path to the genome annotation model
+    :return: True if the file was modified
+    """
+    # Read the file
+    file_path = Path(file_path)
+    content = file_path.read_text()
 
-    # Check if the functions already exist
-    has_hash = re.search(hash_pattern, content[class_start:])
+    # Find the GeneAnnotation class
+    class_node = next(
+        (node for node in ast.parse(content).body if isinstance(node, ast.ClassDef) and node.name == CLASS_NAME), None
+    )
+    if class_node is None:
+        print(f"{CLASS_NAME} class not found in the file.")
+        return False
 
     # Add the functions only if they do not exist
-    if not has_hash:
-        content = content.replace(class_match.group(), class_match.group() + "\n\n    def __hash__(self):\n        return hash(tuple([self.id, self.name, self.molecular_type, self.description]))\n    ")
+    existing_methods = {node.name for node in class_node.body if isinstance(node, ast.FunctionDef)}
+    snippets_needed = [snippet for name, snippet in DUNDER_METHODS.items() if name not in existing_methods]
+    if not snippets_needed:
+        return False
+
+    # the functions are added right after the class docstring (or before the first statement if there is none)
+    first_node = class_node.body[0]
+    if isinstance(first_node, ast.Expr) and isinstance(first_node.value, ast.Constant) and isinstance(first_node.value.value, str):
+        insert_at = first_node.end_lineno
+    else:
+        insert_at = first_node.lineno - 1
+    lines = content.splitlines(keepends=True)
+    lines[insert_at:insert_at] = snippets_needed
+    new_content = "".join(lines)
+    if new_content == content:
+        return False
 
     # Write the updated content back to the file
-    with open(genome_annotation_model, "w") as file:
-        file.write(content)
-else:
-    print("GeneAnnotation class not found in the file.")
+    file_path.write_text(new_content)
+    return True
+
+
+if __name__ == "__main__":
+    genome_annotation_model = pkg_resources.resource_filename(__name__, "../models/genome_annotation.py")
+    add_dunder_methods(genome_annotation_model)
@@ -10,6 +10,7 @@ Options:
     --classes, -c TEXT  Comma-separated list of classes to include in the trimmed schema (required).
     --slots, -s TEXT    Comma-separated list of slots to include in the trimmed schema.
     --enums, -e TEXT    Comma-separated list of enums to include in the trimmed schema.
+    --format [yaml|json]  Format of the trimmed schema (default: yaml).
 
 Example:
     python script.py schema.yaml -c Person,Organization -s name,age -e StatusEnum
@@ -17,7 +18,7 @@ Example:
 The script performs the following steps:
 1. Loads the specified LinkML schema.
 2. Trims the schema by keeping only the specified classes, slots, and enums, along with their dependencies.
-3. Serializes and prints the trimmed schema in YAML format.
+3. Serializes and prints the trimmed schema in YAML (or JSON) format.
 
 Dependencies:
     - click
@@ -26,16 +27,83 @@ Dependencies:
 
 """
 
-from dataclasses import dataclass
+import os
+import sys
+from copy import deepcopy
+from functools import lru_cache
+from itertools import chain
 from typing import Union
 from pathlib import Path
+import yaml
 from linkml_runtime.linkml_model.meta import SchemaDefinition
 from linkml_runtime.utils.schemaview import SchemaView
+from linkml_runtime.dumpers import json_dumper
+from linkml_runtime.utils.yamlutils import DupCheckYamlLoader, extended_float, extended_int, extended_str
 from linkml._version import __version__
 from linkml.generators.yamlgen import YAMLGenerator
 import click
 
-@dataclass
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings are not available
+    from yaml import SafeLoader
+
+
+class _SchemaLoader(SafeLoader):
+    """
+    libyaml based equivalent of linkml-runtime's DupCheckYamlLoader.
+    Only the parser is implemented in C, so the constructors below can still reject duplicate keys and keep the location of the scalars for error messages.
+    """
+
+    def construct_yaml_str(self, node):
+        return extended_str(super().construct_yaml_str(node)).add_node(node)
+
+    def construct_yaml_int(self, node):
+        return extended_int(super().construct_yaml_int(node)).add_node(node)
+
+    def construct_yaml_float(self, node):
+        return extended_float(super().construct_yaml_float(node)).add_node(node)
+
+
+_SchemaLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, DupCheckYamlLoader.map_constructor)
+_SchemaLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, DupCheckYamlLoader.seq_constructor)
+_SchemaLoader.add_constructor("tag:yaml.org,2002:str", _SchemaLoader.construct_yaml_str)
+_SchemaLoader.add_constructor("tag:yaml.org,2002:int", _SchemaLoader.construct_yaml_int)
+_SchemaLoader.add_constructor("tag:yaml.org,2002:float", _SchemaLoader.construct_yaml_float)
+
+# element types used when traversing the schema
+_CLASS, _SLOT, _ENUM = "class", "slot", "enum"
+
+
+@lru_cache(maxsize=8)
+def _load_schema(path: str, mtime: float) -> SchemaDefinition:
+    """
+    Loads and caches a schema file, the modification time is part of the cache key, so the file is reloaded when it changes.
+    The cached schema must not be modified, a copy should be used instead.
+    The file is parsed with the libyaml loader (if available), which is much faster than the default loader used by linkml-runtime.
+    """
+    with open(path) as file:
+        schema = SchemaDefinition(**yaml.load(file, Loader=_SchemaLoader))
+    # source_file is used to resolve local imports
+    schema.source_file = path
+    return schema
+
+
+def _reachable(graph: dict[str, list[str]], sources: list[str]) -> set[str]:
+    """
+    Returns all nodes of the graph that are reachable from the sources (including the sources).
+    Nodes are marked as visited when they are added to the stack, so every node is expanded only once.
+    """
+    visited = set(sources)
+    stack = list(visited)
+    while stack:
+        for node in graph[stack.pop()]:
+            if node not in visited:
+                visited.add(node)
+                stack.append(node)
+    return visited
+
+
 class YamlTrimmer:
     """
     A utility class for trimming a LinkML schema by retaining specified classes, slots, and enums, along with their dependencies.
@@ -43,124 +111,149 @@ class YamlTrimmer:
     This class helps in generating a simplified version of a LinkML schema by removing all elements that are not reachable from the specified classes, slots, and enums to keep.
 
     Args:
-        schema (Union[str, Path, SchemaDefinition]): The LinkML schema to be trimmed. It can be a file path, URL, or a `SchemaDefinition` object.
+        schema (Union[str, Path, SchemaDefinition, SchemaView]): The LinkML schema to be trimmed. It can be a file path, URL, a `SchemaDefinition` or a `SchemaView` object.
+            Schema files are parsed once and cached, every trimmer works on its own copy of the cached schema.
+            `SchemaDefinition` and `SchemaView` objects are used without copying, so they are modified by `trim_model`.
 
     Attributes:
         schemaview (SchemaView): An object representing the loaded schema, used for manipulation and traversal.
 
     Methods:
-        trim_model(keep_classes: list[str], keep_slots: list[str] = [], keep_enums: list[str] = []):
+        trim_model(keep_classes: list[str], keep_slots: list[str] = None, keep_enums: list[str] = None):
             Trims the schema by keeping only the specified classes, slots, and enums, and their dependencies.
 
-        serialize():
-            Serializes and prints the trimmed schema in YAML format.
+        serialize(out=None, fmt="yaml"):
+            Serializes the trimmed schema in YAML (or JSON) format and writes it to `out` (stdout by default).
 
     Example:
         >>> yt = YamlTrimmer('path/to/schema.yaml')
         >>> yt.trim_model(['Person', 'Organization'], keep_slots=['name'], keep_enums=['StatusEnum'])
         >>> yt.serialize()
     """
-    def __init__(self, schema: Union[str, Path, SchemaDefinition]):
-        self.schemaview = SchemaView(schema)
+    __slots__ = ("schemaview",)
+
+    def __init__(self, schema: Union[str, Path, SchemaDefinition, SchemaView]):
+        if isinstance(schema, SchemaView):
+            self.schemaview = schema
+        elif isinstance(schema, (str, Path)) and os.path.isfile(schema):
+            cached_schema = _load_schema(os.path.abspath(schema), os.path.getmtime(schema))
+            self.schemaview = SchemaView(deepcopy(cached_schema))
+        else:
+            self.schemaview = SchemaView(schema)
+
+    def _build_adjacency(self, kind_of: dict[str, str]) -> dict[str, list[str]]:
+        """
+        Builds the dependency graph of the schema in a single pass over its classes, slots, and enums.
+
+        Args:
+            kind_of (dict[str, str]): Maps every class, slot, and enum name to its element type.
+
+        Returns:
+            dict[str, list[str]]: Maps every element to the elements it depends on:
+                classes to their parent classes and slots, slots to their ranges (classes or enums) and parent slots,
+                and enums to their parent enums.
+        """
+        sv = self.schemaview
+
+        def of_kind(nodes, *kinds):
+            return [node for node in nodes if kind_of.get(node) in kinds]
+
+        adjacency = {}
+        for node, kind in kind_of.items():
+            if kind == _CLASS:
+                adjacency[node] = of_kind(sv.class_parents(node, imports=False), _CLASS) + of_kind(
+                    sv.class_slots(node, imports=False, direct=True, attributes=True), _SLOT
+                )
+            elif kind == _SLOT:
+                adjacency[node] = of_kind(
+                    sv.slot_range_as_union(sv.get_slot(node, strict=True)), _CLASS, _ENUM
+                ) + of_kind(sv.slot_parents(node, imports=False), _SLOT)
+            else:
+                adjacency[node] = of_kind(sv.enum_parents(node, imports=False), _ENUM)
+        return adjacency
 
     def trim_model(
         self,
         keep_classes: list[str],
-        keep_slots: list[str] = [],
-        keep_enums: list[str] = [],
+        keep_slots: list[str] = None,
+        keep_enums: list[str] = None,
     ):
         """
         Trims the model by removing classes, slots, and enums that are not reachable from the specified keep_classes, keep_slots, and keep_enums.
 
         Args:
             keep_classes (list[str]): List of classes to keep.
-            keep_slots (list[str], optional): List of slots to keep. Defaults to [].
-            keep_enums (list[str], optional): List of enums to keep. Defaults to [].
+            keep_slots (list[str], optional): List of slots to keep. Defaults to None.
+            keep_enums (list[str], optional): List of enums to keep. Defaults to None.
         """
         sv = self.schemaview
-        # vistited_classes, visited_enums, and visited slots keep track of the classes, enums, and slots that are reachable from the input class, slots, and enums we are interested in keeping
-        visited_classes = set()
-        visited_slots = set()
-        visited_enums = set()
-
-        # stack is a list of classes, enums, and slots that we will traverse to find all reachable classes, enums, and slots
-        stack = []
-        stack.extend(keep_classes)
-        stack.extend(keep_slots)
-        stack.extend(keep_enums)
-
-        # all_classes, all_enums, and all_slots are the set of all classes, enums, and slots defined in the given schema
-        all_classes = set(sv.all_classes(imports=False))
-        all_enums = set(sv.all_enums(imports=False))
-        all_slots = set(sv.all_slots(imports=False, attributes=False))
-
-        while stack:
-            curr_node = stack.pop()
-            if (
-                curr_node in visited_classes
-                or curr_node in visited_enums
-                or curr_node in visited_slots
-            ):
-                continue
-
-            # if curr_node is a class
-            if curr_node in all_classes:
-                visited_classes.add(curr_node)
-                # add parent classes to stack
-                for inherited_class in sv.class_parents(curr_node, imports=False):
-                    if (
-                        inherited_class not in visited_classes
-                        and inherited_class in all_classes
-                    ):
-                        stack.append(inherited_class)
-
-                # iterate through attributes/slots and add respective range to stack if type is a class or enum
-                for slot in sv.class_slots(
-                    curr_node, imports=False, direct=True, attributes=True
-                ):
-                    if slot not in visited_slots and slot in all_slots:
-                        stack.append(slot)
-
-            elif curr_node in all_slots:
-                visited_slots.add(curr_node)
-                for slot_range in sv.slot_range_as_union(
-                    sv.get_slot(curr_node, strict=True)
-                ):
-                    if (
-                        slot_range in all_classes and slot_range not in visited_classes
-                    ) or (slot_range in all_enums and slot_range not in visited_enums):
-                        stack.append(slot_range)
-                for parent_slot in sv.slot_parents(curr_node, imports=False):
-                    if parent_slot not in visited_slots and parent_slot in all_slots:
-                        stack.append(parent_slot)
-
-            elif curr_node in all_enums:
-                visited_enums.add(curr_node)
-                # add parent classes to stack
-                for parent_enum in sv.enum_parents(curr_node, imports=False):
-                    if parent_enum not in visited_enums and parent_enum in all_enums:
-                        stack.append(parent_enum)
+        keep_nodes = list(chain(keep_classes, keep_slots or (), keep_enums or ()))
 
-            else:
+        # kind_of maps every class, enum, and slot defined in the given schema to its type
+        # (if a name is used more than once, classes take precedence over slots, and slots over enums)
+        kind_of = dict.fromkeys(sv.all_enums(imports=False), _ENUM)
+        kind_of.update(dict.fromkeys(sv.all_slots(imports=False, attributes=False), _SLOT))
+        kind_of.update(dict.fromkeys(sv.all_classes(imports=False), _CLASS))
+
+        for node in keep_nodes:
+            if node not in kind_of:
                 raise ValueError(
-                    f"ERROR: {curr_node} not found in schema classes, slots, or enums"
+                    f"ERROR: {node} not found in schema classes, slots, or enums"
                 )
 
-        for c in all_classes:
-            if c not in visited_classes:
-                sv.delete_class(c)
-        for e in all_enums:
-            if e not in visited_enums:
-                sv.delete_enum(e)
-        for s in all_slots:
-            if s not in visited_slots:
-                sv.delete_slot(s)
-
-    def serialize(self):
+        # all classes, enums, and slots that are reachable from the input class, slots, and enums we are interested in keeping
+        visited = _reachable(self._build_adjacency(kind_of), keep_nodes)
+        visited_by_kind = {_CLASS: set(), _SLOT: set(), _ENUM: set()}
+        for node in visited:
+            visited_by_kind[kind_of[node]].add(node)
+        # the traversal is finished, so the visited elements are frozen for the deletion phase
+        visited_classes = frozenset(visited_by_kind[_CLASS])
+        visited_slots = frozenset(visited_by_kind[_SLOT])
+        visited_enums = frozenset(visited_by_kind[_ENUM])
+
+        # removing unreachable elements directly from the schema and invalidating the schemaview caches only once
+        # (sv.delete_* would invalidate them after every deletion; references to deleted classes are not removed,
+        # but they can only exist in classes that are deleted as well, since parents of kept classes are kept)
+        # (the dictionaries are modified in place, assigning new dictionaries would convert them to JsonObj)
+        for elements, keep in (
+            (sv.schema.classes, visited_classes),
+            (sv.schema.enums, visited_enums),
+            (sv.schema.slots, visited_slots),
+        ):
+            for name in [name for name in elements if name not in keep]:
+                del elements[name]
+        sv.set_modified()
+
+    def serialize(self, out=None, fmt: str = "yaml"):
         """
-        Serializes the schema using YAMLGenerator and prints the serialized output.
+        Serializes the schema and writes the serialized output.
+
+        Args:
+            out (file, optional): File handle the output is written to. Defaults to sys.stdout.
+            fmt (str, optional): Output format, "yaml" (using YAMLGenerator) or "json". Defaults to "yaml".
+                The json output is a plain dump of the schema, which is much faster to produce for large schemas.
         """
-        print(YAMLGenerator(self.schemaview.schema).serialize())
+        out = sys.stdout if out is None else out
+        # writing the output directly (print would create another copy of the serialized schema)
+        if fmt == "json":
+            out.write(json_dumper.dumps(self.schemaview.schema, inject_type=False))
+        elif fmt == "yaml":
+            out.write(YAMLGenerator(self.schemaview.schema).serialize())
+        else:
+            raise ValueError(f"ERROR: unsupported output format {fmt}")
+        out.write("\n")
+
+
+class CSVList(click.ParamType):
+    """
+    Click parameter type for comma-separated lists, the values are split and stripped when the option is parsed.
+    """
+    name = "csv"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, list):
+            return value
+        return [x.strip() for x in value.split(",")] if value else []
 
 
 @click.command()
@@ -170,23 +263,21 @@ class YamlTrimmer:
 
 ## OPTIONS ##
 # Option #1: Classes
-@click.option('--classes', '-c', required=True, help='Comma-separated list of classes to include in trimmed schema')
+@click.option('--classes', '-c', type=CSVList(), required=True, help='Comma-separated list of classes to include in trimmed schema')
 # Option #2: Slots
-@click.option('--slots', '-s', help='Comma-separated list of slots to include in trimmed schema')
+@click.option('--slots', '-s', type=CSVList(), help='Comma-separated list of slots to include in trimmed schema')
 # Option #3: Enums
-@click.option('--enums', '-e', help='Comma-separated list of enums to include in trimmed schema')
+@click.option('--enums', '-e', type=CSVList(), help='Comma-separated list of enums to include in trimmed schema')
+# Option #4: Output format
+@click.option('--format', 'fmt', type=click.Choice(['yaml', 'json']), default='yaml', show_default=True, help='Format of the trimmed schema')
 
-def linkml_trimmer(schema, classes, slots, enums):
+def linkml_trimmer(schema, classes, slots, enums, fmt):
     """
     Trim a LinkMl schema based on a list of classes, slots, and enums to keep.
     """
-    classes = classes.split(',')
-    slots = slots.split(',') if slots else []
-    enums = enums.split(',') if enums else []
-
     yt = YamlTrimmer(schema)
     yt.trim_model(classes, slots, enums)
-    yt.serialize()
+    yt.serialize(fmt=fmt)
 
 if __name__ == "__main__":
     linkml_trimmer()
@@ -0,0 +1,72 @@
+import warnings
+import pytest
+from pydantic import ConfigDict, ValidationError
+from bkbit.models import library_generation as lg
+
+
+def test_category_default():
+    donor = lg.Donor(id="NIMP:DO-1")
+    assert donor.category == ["bican:Donor"]
+
+
+@pytest.mark.parametrize("category", [["bican:Donor"], ["https://identifiers.org/brain-bican/vocab/Donor"]])
+def test_category_allowed_values(category):
+    assert lg.Donor(id="NIMP:DO-1", category=category).category == category
+
+
+@pytest.mark.parametrize("category", [["bican:BrainSlab"], ["bican:donor"], ["biolink:Donor"]])
+def test_category_invalid_values(category):
+    with pytest.raises(ValidationError):
+        lg.Donor(id="NIMP:DO-1", category=category)
+
+
+def test_category_validated_on_assignment():
+    class StrictDonor(lg.Donor):
+        model_config = ConfigDict(validate_assignment=True)
+
+    donor = StrictDonor(id="NIMP:DO-1")
+    with pytest.raises(ValidationError):
+        donor.category = ["bican:BrainSlab"]
+
+
+def test_assignment_not_validated_by_default():
+    donor = lg.Donor(id="NIMP:DO-1")
+    donor.category = ["bican:BrainSlab"]
+    with pytest.raises(ValidationError):
+        lg.Donor.model_validate(donor.model_dump())
+
+
+def test_category_has_no_python_validators():
+    # the allowed category values are enforced by the Literal type in pydantic-core
+    assert not lg.Donor.__pydantic_decorators__.field_validators
+
+
+def test_category_default_not_shared():
+    first, second = lg.Donor(id="NIMP:DO-1"), lg.Donor(id="NIMP:DO-2")
+    first.category.append("https://identifiers.org/brain-bican/vocab/Donor")
+    assert second.category == ["bican:Donor"]
+
+
+def test_from_trusted():
+    data = lg.Donor(id="NIMP:DO-1", name="donor").model_dump(exclude_unset=True)
+    donor = lg.Donor.from_trusted(**data)
+    assert donor.id == "NIMP:DO-1" and donor.name == "donor"
+    assert donor.category == ["bican:Donor"]
+    # the default is a list, so the model serializes without warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert donor.model_dump()["category"] == ["bican:Donor"]
+        donor.model_dump_json()
+
+
+def test_validate_many():
+    donors = lg.Donor.validate_many([{"id": "NIMP:DO-1"}, {"id": "NIMP:DO-2", "name": "donor"}])
+    assert donors == [lg.Donor(id="NIMP:DO-1"), lg.Donor(id="NIMP:DO-2", name="donor")]
+    with pytest.raises(ValidationError):
+        lg.Donor.validate_many([{"id": "NIMP:DO-1"}, {"id": "NIMP:DO-2", "category": ["bican:BrainSlab"]}])
+
+
+def test_schemas_built_on_first_use():
+    # mixins such as PhysicalEssence are never instantiated, so their schema is never built
+    assert not lg.PhysicalEssence.__pydantic_complete__
+    assert lg.Donor(id="NIMP:DO-1") and lg.Donor.__pydantic_complete__
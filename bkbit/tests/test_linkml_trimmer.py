@@ -0,0 +1,174 @@
+import json
+import pytest
+from click.testing import CliRunner
+from bkbit.model_editors.linkml_trimmer import YamlTrimmer, linkml_trimmer
+
+
+@pytest.fixture()
+def schema_file(tmp_path):
+    # create a small schema with classes, slots, and enums that are not all reachable from each other
+    temp_file = tmp_path / "schema.yaml"
+    temp_file.write_text("""id: https://example.org/trim
+name: trim
+default_prefix: ex
+prefixes:
+  ex: https://example.org/
+  linkml: https://w3id.org/linkml/
+imports:
+  - linkml:types
+default_range: string
+classes:
+  NamedThing:
+    slots: [id, name]
+  Person:
+    is_a: NamedThing
+    slots: [age, friend, status]
+  Employee:
+    is_a: Person
+    mixins: [Tagged]
+    slots: [employer]
+  Tagged:
+    mixin: true
+    slots: [tag]
+  Org:
+    is_a: NamedThing
+    slots: [member]
+  Unused:
+    slots: [foo]
+slots:
+  id:
+    identifier: true
+  name: {}
+  age:
+    range: integer
+  friend:
+    any_of:
+      - range: Person
+      - range: Org
+  status:
+    range: StatusEnum
+  employer:
+    range: Org
+  member:
+    range: Person
+    multivalued: true
+  tag:
+    range: TagEnum
+  foo:
+    range: OtherEnum
+  orphan:
+    range: Unused
+  sub_name:
+    is_a: name
+enums:
+  StatusEnum:
+    permissible_values:
+      ALIVE:
+      DEAD:
+  TagEnum:
+    permissible_values:
+      A:
+  OtherEnum:
+    permissible_values:
+      X:
+""")
+    return str(temp_file)
+
+
+def _kept_elements(yt):
+    schema = yt.schemaview.schema
+    return set(schema.classes), set(schema.slots), set(schema.enums)
+
+
+def test_trim_model_class(schema_file):
+    yt = YamlTrimmer(schema_file)
+    yt.trim_model(["Person"])
+    assert _kept_elements(yt) == (
+        {"NamedThing", "Person", "Org"},
+        {"id", "name", "age", "friend", "status", "member"},
+        {"StatusEnum"},
+    )
+    # schemaview caches are refreshed after trimming
+    assert set(yt.schemaview.all_classes(imports=False)) == {"NamedThing", "Person", "Org"}
+
+
+def test_trim_model_mixins_and_enums(schema_file):
+    yt = YamlTrimmer(schema_file)
+    yt.trim_model(["Employee"], keep_enums=["OtherEnum"])
+    assert _kept_elements(yt) == (
+        {"NamedThing", "Person", "Org", "Employee", "Tagged"},
+        {"id", "name", "age", "friend", "status", "member", "employer", "tag"},
+        {"StatusEnum", "TagEnum", "OtherEnum"},
+    )
+
+
+def test_trim_model_slots(schema_file):
+    yt = YamlTrimmer(schema_file)
+    yt.trim_model(["NamedThing"], keep_slots=["orphan", "sub_name"])
+    assert _kept_elements(yt) == (
+        {"NamedThing", "Unused"},
+        {"id", "name", "orphan", "sub_name", "foo"},
+        {"OtherEnum"},
+    )
+
+
+def test_trim_model_unknown_element(schema_file):
+    yt = YamlTrimmer(schema_file)
+    with pytest.raises(ValueError):
+        yt.trim_model(["NotInSchema"])
+
+
+def test_trim_model_reuses_cached_schema(schema_file):
+    yt_first = YamlTrimmer(schema_file)
+    yt_first.trim_model(["Org"])
+    # the second trimmer starts from the full schema, not from the trimmed one
+    yt_second = YamlTrimmer(schema_file)
+    assert "Unused" in yt_second.schemaview.schema.classes
+    yt_second.trim_model(["Unused"])
+    assert _kept_elements(yt_second) == ({"Unused"}, {"foo"}, {"OtherEnum"})
+
+
+def test_serialize_to_file(schema_file, tmp_path):
+    yt = YamlTrimmer(schema_file)
+    yt.trim_model(["Org"])
+    out_file = tmp_path / "trimmed.yaml"
+    with open(out_file, "w") as out:
+        yt.serialize(out)
+    trimmed = YamlTrimmer(str(out_file))
+    assert _kept_elements(trimmed) == _kept_elements(yt)
+
+
+def test_cli_comma_separated_options(schema_file, tmp_path):
+    result = CliRunner().invoke(linkml_trimmer, [schema_file, "-c", "NamedThing", "-s", "orphan, sub_name"])
+    assert result.exit_code == 0, result.output
+    out_file = tmp_path / "trimmed.yaml"
+    out_file.write_text(result.output)
+    assert _kept_elements(YamlTrimmer(str(out_file))) == (
+        {"NamedThing", "Unused"},
+        {"id", "name", "orphan", "sub_name", "foo"},
+        {"OtherEnum"},
+    )
+
+
+def test_serialize_json(schema_file, tmp_path):
+    yt = YamlTrimmer(schema_file)
+    yt.trim_model(["Org"])
+    out_file = tmp_path / "trimmed.json"
+    with open(out_file, "w") as out:
+        yt.serialize(out, fmt="json")
+    trimmed = json.loads(out_file.read_text())
+    assert (set(trimmed["classes"]), set(trimmed["slots"]), set(trimmed["enums"])) == _kept_elements(yt)
+
+
+def test_duplicate_key_rejected(tmp_path):
+    temp_file = tmp_path / "duplicate.yaml"
+    temp_file.write_text("""id: https://example.org/dup
+name: dup
+classes:
+  Org:
+    description: first
+  Org:
+    description: second
+""")
+    with pytest.raises(ValueError, match='Duplicate key: "Org"'):
+        YamlTrimmer(str(temp_file))